@@ -0,0 +1,78 @@
+"""Import-time budget for the package and each of its modules, measured
+with 'python -X importtime' in a fresh interpreter per run.
+
+For every module, the best cumulative import time over a few runs must stay
+within its budget, and the import must not pull in any of the heavy modules
+listed in FORBIDDEN. Importing the bare package must not load any submodule.
+Exits with status 1 if any check fails.
+
+Run from the repository root with:
+
+    python benchmarks/importtime.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Best cumulative import time allowed, in microseconds
+BUDGETS = {
+    "pycollections": 1000,
+    "pycollections.containers": 3000,
+    "pycollections.records": 3000,
+    "pycollections.constants": 3000,
+}
+FORBIDDEN = ("threading", "ast", "inspect")
+RUNS = 7
+
+
+def import_trace(statement, env):
+    """Runs statement in a fresh interpreter and returns the
+    {module: cumulative microseconds} couples of its import trace"""
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=env,
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    trace = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                trace[module.strip()] = int(cumulative)
+    return trace
+
+
+def main():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    # Measure with a warm bytecode cache, even where writing bytecode is disabled
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    failures = []
+    with tempfile.TemporaryDirectory() as cache:
+        env["PYTHONPYCACHEPREFIX"] = cache
+        startup = set(import_trace("pass", env))
+        for module, budget in BUDGETS.items():
+            import_trace(f"import {module}", env)  # Warms the bytecode cache
+            traces = [import_trace(f"import {module}", env) for _ in range(RUNS)]
+            best = min(trace[module] for trace in traces)
+            loaded = set(traces[0]) - startup
+            status = "ok" if best <= budget else "OVER BUDGET"
+            print(f"{module:<28} {best:6d} us  (budget {budget:6d} us)  {status}")
+            if best > budget:
+                failures.append(f"{module} took {best} us, budget is {budget} us")
+            for heavy in FORBIDDEN:
+                if heavy in loaded:
+                    failures.append(f"{module} imports {heavy}")
+            if module == "pycollections":
+                eager = sorted(name for name in loaded if name.startswith("pycollections."))
+                if eager:
+                    failures.append(f"pycollections eagerly imports {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
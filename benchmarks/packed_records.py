@@ -0,0 +1,72 @@
+"""Bytes per record and scan speed of PackedSchema records, read through
+PackedNamedTuple views over bytes and mmap, against object-based NamedTuples.
+
+Run from the repository root with:
+
+    python benchmarks/packed_records.py
+"""
+
+import mmap
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pycollections.containers import NamedTuple
+from pycollections.records import PackedSchema
+
+RECORDS = 20000
+REPEAT = 5
+
+
+def deep_size(obj, seen=None):
+    """Returns the size of obj together with everything it references"""
+
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key, seen) + deep_size(value, seen) for key, value in obj.items())
+    elif type(obj) in (tuple, list):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(type(obj), "__dict__") and not isinstance(obj, type):
+        try:
+            size += deep_size(object.__getattribute__(obj, "__dict__"), seen)
+        except AttributeError:
+            pass
+    return size
+
+
+def best(statement):
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT)) * 1000
+
+
+def main():
+    random.seed(0)
+    rows = [(index, random.random() * 100, index % 500) for index in range(RECORDS)]
+    schema = PackedSchema(ts='q', price='d', qty='I')
+    block = schema.pack_many(rows)
+    objects = [NamedTuple(ts=ts, price=price, qty=qty) for ts, price, qty in rows]
+
+    print(f"{RECORDS} records, schema {schema}")
+    print("bytes per record")
+    print(f"  packed               {len(block) / RECORDS:10.1f}")
+    print(f"  NamedTuple           {sum(deep_size(record) for record in objects) / RECORDS:10.1f}")
+
+    with tempfile.TemporaryFile() as file:
+        file.write(block)
+        file.flush()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            print(f"scan of one field, best of {REPEAT}")
+            print(f"  packed (bytes)       {best(lambda: sum(r['price'] for r in schema.iter_views(block))):8.2f} ms")
+            print(f"  packed (mmap)        {best(lambda: sum(r['price'] for r in schema.iter_views(mapped))):8.2f} ms")
+            print(f"  NamedTuple           {best(lambda: sum(r['price'] for r in objects)):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Owner-loop throughput of an acquired RLockedList: guarded access, access
+through an RLockedListHandle and through handle.list, against a plain list.
+
+Run from the repository root with:
+
+    python benchmarks/rlockedlist_handle.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pycollections.containers import RLockedList
+
+SIZE = 1000
+NUMBER = 200
+REPEAT = 5
+
+
+def best(statement):
+    return min(timeit.repeat(statement, number=NUMBER, repeat=REPEAT)) * 1000
+
+
+def main():
+    plain = list(range(SIZE))
+    rlist = RLockedList(*plain)
+    with rlist as handle:
+        direct = handle.list
+        indexed = {
+            "plain list": lambda: [plain[i] for i in range(SIZE)],
+            "handle.list": lambda: [direct[i] for i in range(SIZE)],
+            "handle": lambda: [handle[i] for i in range(SIZE)],
+            "guarded RLockedList": lambda: [rlist[i] for i in range(SIZE)],
+        }
+        iterated = {
+            "plain list": lambda: [item for item in plain],
+            "handle.list": lambda: [item for item in direct],
+            "handle": lambda: [item for item in handle],
+        }
+        print(f"{SIZE} items x {NUMBER} passes, best of {REPEAT}")
+        for title, statements in (("indexed loop", indexed), ("iteration", iterated)):
+            print(title)
+            for name, statement in statements.items():
+                print(f"  {name:<20} {best(statement):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
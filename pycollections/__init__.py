@@ -2,3 +2,32 @@ __author__ = "Nocturn9x aka IsGiambyy"
 __version__ = "0.2"
 __website__ = "https://github.com/nocturn9x"
 name = "PyCollections"
+
+# Public classes are loaded lazily (PEP 562), so that importing the package
+# only loads the module of the container that is actually used
+_lazy_attributes = {
+    "ConstantDict": "containers",
+    "NamedTuple": "containers",
+    "LockedList": "containers",
+    "RLockedList": "containers",
+    "RLockedListHandle": "containers",
+    "FixedList": "containers",
+    "PackedSchema": "records",
+    "PackedNamedTuple": "records",
+    "Const": "constants",
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(attr):
+    if attr in _lazy_attributes:
+        from importlib import import_module
+        value = getattr(import_module(f".{_lazy_attributes[attr]}", __name__), attr)
+        globals()[attr] = value  # Later lookups don't go through here anymore
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{attr}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,5 @@
-from pycollectionserrors.exceptions import Errors as errors
-import inspect
+from .errors import exceptions as errors
+import sys
 
 
 class Const:
@@ -15,7 +15,7 @@ class Const:
         dict.__contains__(self.__d, key)
 
     def __setattr__(self, key, value):
-        if inspect.stack()[1][3] != "__init__":
+        if sys._getframe(1).f_code.co_name != "__init__":  # Same check as inspect.stack()[1][3], without importing inspect
             if isinstance(value, int) or isinstance(value, float):
                 if key in self.__d:
                     raise errors.ConstantError(
@@ -1,6 +1,17 @@
-import threading
 from .errors.exceptions import *
-from ast import literal_eval as make_collection
+
+
+_current_thread = None  # threading.current_thread, bound by the first _current_thread_name() call
+
+
+def _current_thread_name():
+    """Returns the name of the running thread, importing threading
+    here keeps it off the package import path"""
+
+    global _current_thread
+    if _current_thread is None:
+        from threading import current_thread as _current_thread
+    return _current_thread().name
 
 
 class ConstantDict(dict):
@@ -202,6 +213,7 @@ class NamedTuple(tuple):
                 arg = arg.replace(b'\00'.decode("utf-8"), "")
                 from_index = arg.find("=") + 1
                 key = arg[0:from_index - 1].replace("<", "")
+                from ast import literal_eval as make_collection  # Only collection values need ast
                 self._dict[key] = make_collection(arg[from_index:])
             elif arg:
                 try:
@@ -445,6 +457,7 @@ class RLockedList(LockedList):
     def __init__(self, *args):
         super().__init__(*args)
         self._owner = None
+        self._handles = []  # Handles given out by acquire(), invalidated on release()
 
     @property
     def owner(self):
@@ -462,46 +475,57 @@ class RLockedList(LockedList):
         if not self._status:
             self._container.extend(iterable)
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.extend(iterable)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __getitem__(self, item):
         if not self._status:
             return self._container.__getitem__(item)
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.__getitem__(item)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __getattribute__(self, item):
-        if not self._status:
-            return self._container.__getattribute__(item)
-        else:
-            if threading.current_thread().name == self._owner:
-                return self._container.__getattribute__(item)
-            else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+        if (item.startswith("__") and item.endswith("__")) or item in ("_status", "_owner", "_handles", "_as_list",
+                                                                        "acquire", "release", "owner", "status"):
+            # The state the checks below need and the ownership API must stay reachable,
+            # or every lookup would recurse back in here. Everything else, _container
+            # included, is only given to the owner while the list is acquired
+            return super().__getattribute__(item)
+        if super().__getattribute__("_status") and _current_thread_name() != super().__getattribute__("_owner"):
+            raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
+        for klass in type(self).__mro__:
+            if klass is list:
+                if item in vars(list):
+                    # List methods that aren't overridden must act on the real items,
+                    # not on the (always empty) storage inherited from list
+                    return getattr(super().__getattribute__("_container"), item)
+                break
+            if item in vars(klass):
+                break
+        return super().__getattribute__(item)
 
     def __delitem__(self, item):
         if not self._status:
             return self._container.__delitem__(item)
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.__delitem__(item)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __add__(self, other):
         if not self._status:
             return self._container.__add__(other)
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.__add__(other)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __mul__(self, other):
         return self._container.__add__(other)
@@ -513,71 +537,88 @@ class RLockedList(LockedList):
         if not self._status:
             return self._container.__imul__(other)
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.__imul__(other)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __reversed__(self):
         if not self._status:
             return self._container.__reversed__()
         else:
-            if threading.current_thread().name == self._owner:
+            if _current_thread_name() == self._owner:
                 return self._container.__reversed__()
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def append(self, item):
         if not self._status:
-            self._container.append(item)
-            if threading.current_thread().name == self._owner:
+            return self._container.append(item)
+        else:
+            if _current_thread_name() == self._owner:
                 return self._container.append(item)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def index(self, value, start=0, stop=9223372036854775807):
         if not self._status:
             return self._container.index(value, start, stop)
         else:
-            if self._owner == threading.current_thread().name:
+            if self._owner == _current_thread_name():
                 return self._container.index(value, start, stop)
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
-    def acquire(self):
+    def acquire(self, handle=False):
         """Acquires the container, disallowing access to the list's items
-        to any thread except for the owner"""
+        to any thread except for the owner.
+
+        If handle is True, an RLockedListHandle bound to the owner is returned:
+        ownership is checked once here, and the handle then accesses the list
+        directly, with no per-call checks, until the container is released"""
 
         if self._owner is None:
             self._status = True
-            self._owner = threading.current_thread().name
+            self._owner = _current_thread_name()
         else:
             raise InvalidOperation(f"thread '{self._owner}' didn't release the container yet")
+        if handle:
+            owner_handle = RLockedListHandle(self._container)
+            self._handles.append(owner_handle)
+            return owner_handle
 
     def release(self):
-        """Releases the container, allowing access to the list's items globally"""
+        """Releases the container, allowing access to the list's items globally.
+
+        Any handle returned by acquire() is invalidated"""
 
         if not self._status:
             raise InvalidOperation("container is un-acquired")
-        else:
+        if _current_thread_name() == self._owner:
+            self._status = False
             self._owner = None
-        if threading.current_thread().name == self._owner:
-            if self._status:
-                self._status = False
-                self._owner = None
-            else:
-                raise InvalidOperation("container is un-acquired")
+            for owner_handle in self._handles:
+                owner_handle.invalidate()
+            self._handles.clear()
         else:
-            raise InvalidOperation(f"cannot release, '{threading.current_thread().name}' is not the container owner")
+            raise InvalidOperation(f"cannot release, '{_current_thread_name()}' is not the container owner")
+
+    def __enter__(self):
+        """Acquires the container and returns an owner handle, see acquire()"""
+
+        return self.acquire(handle=True)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
 
     def __iter__(self):
         if not self._status:
             return self._container.__iter__()
         else:
-            if self._owner == threading.current_thread().name:
+            if self._owner == _current_thread_name():
                 return self._container.__iter__()
             else:
-                raise AccessDeniedError(f"thread '{threading.current_thread().name}' is not the container owner")
+                raise AccessDeniedError(f"thread '{_current_thread_name()}' is not the container owner")
 
     def __str__(self):
         return super().__str__()
@@ -610,14 +651,14 @@ class RLockedList(LockedList):
            See 'typeof' and '__class__' properties for more info"""
 
         if self._status:
-            if self._owner == threading.current_thread().name:
+            if self._owner == _current_thread_name():
                 if self._as_list:
                     self._as_list = False
                 else:
                     self._as_list = True
                 return self._as_list
             else:
-                raise AccessDeniedError(f"thread {threading.current_thread().name} is not the container owner")
+                raise AccessDeniedError(f"thread {_current_thread_name()} is not the container owner")
         else:
             if self._as_list:
                 self._as_list = False
@@ -626,6 +667,131 @@ class RLockedList(LockedList):
             return self._as_list
 
 
+class _ReleasedContainer:
+    """Stand-in for the list of an invalidated RLockedListHandle, every
+    access attempt fails"""
+
+    def _released(self, *args, **kwargs):
+        raise InvalidOperation("handle is invalid, the container was released")
+
+    __getitem__ = __setitem__ = __delitem__ = __len__ = __iter__ = __contains__ = __reversed__ = _released
+
+    def __getattr__(self, item):
+        return self._released()
+
+
+class RLockedListHandle:
+    """Owner-bound handle returned by RLockedList.acquire(handle=True), or by
+    a 'with' block on an RLockedList:
+
+        >>> with rlist as handle:
+        ...     for i in range(len(handle)):
+        ...         handle[i]
+
+    The handle gives the owner thread access to the list's items without the
+    ownership check RLockedList performs on every call. It must not be shared
+    with other threads: they have to keep using the guarded RLockedList itself.
+
+    Once the container is released the handle is invalidated, and any further
+    access raises InvalidOperation, including through iterators and methods
+    (e.g. handle.append) taken from the handle before the release.
+
+    Every access through the handle still costs a Python-level call: for
+    list-speed loops inside the owned section, use handle.list, the underlying
+    list itself. References to handle.list kept after the release are NOT
+    invalidated, so they must not outlive the owned section"""
+
+    __slots__ = ("_container",)
+
+    def __init__(self, container):
+        """Initializes self"""
+
+        self._container = container
+
+    def invalidate(self):
+        """Detaches the handle from the list, called by RLockedList.release()"""
+
+        self._container = _ReleasedContainer()
+
+    @property
+    def valid(self):
+        """Returns whether the handle still gives access to the list"""
+
+        return not isinstance(self._container, _ReleasedContainer)
+
+    @property
+    def list(self):
+        """Returns the underlying list, for direct access during the owned section"""
+
+        if not self.valid:
+            self._container._released()
+        return self._container
+
+    def _checked(self, container, iterator):
+        # Wraps iterators, so that they stop working once the handle is invalidated
+        for item in iterator:
+            if self._container is not container:
+                self._container._released()
+            yield item
+
+    def __getitem__(self, item):
+        return self._container[item]
+
+    def __setitem__(self, key, value):
+        self._container[key] = value
+
+    def __delitem__(self, item):
+        del self._container[item]
+
+    def __len__(self):
+        return len(self._container)
+
+    def __iter__(self):
+        return self._checked(self._container, iter(self._container))
+
+    def __contains__(self, item):
+        return item in self._container
+
+    def __reversed__(self):
+        return self._checked(self._container, reversed(self._container))
+
+    def append(self, item):
+        self._container.append(item)
+
+    def extend(self, iterable):
+        self._container.extend(iterable)
+
+    def insert(self, index, item):
+        self._container.insert(index, item)
+
+    def pop(self, index=-1):
+        return self._container.pop(index)
+
+    def remove(self, item):
+        self._container.remove(item)
+
+    def clear(self):
+        self._container.clear()
+
+    def index(self, value, start=0, stop=9223372036854775807):
+        return self._container.index(value, start, stop)
+
+    def count(self, value):
+        return self._container.count(value)
+
+    def sort(self, *, key=None, reverse=False):
+        self._container.sort(key=key, reverse=reverse)
+
+    def reverse(self):
+        self._container.reverse()
+
+    def copy(self):
+        return self._container.copy()
+
+    def __repr__(self):
+        return f"RLockedListHandle({self._container!r})" if self.valid else "RLockedListHandle(<released>)"
+
+
 class FixedList(list):
 
     def __init__(self, *args, size_limit=None):
@@ -0,0 +1,193 @@
+import struct
+
+
+class PackedSchema:
+    """This class describes a fixed layout of named, numeric (or fixed-size bytes)
+    fields, each one declared with a 'struct' format code, and is used to store
+    many records packed together inside a single contiguous binary block
+    (bytes, bytearray, mmap, or anything else supporting the buffer protocol).
+
+    Instead of keeping every record as a NamedTuple, that is a bunch of boxed
+    Python objects, records are kept as raw bytes and read back through
+    PackedNamedTuple views, which decode fields only when they're accessed
+    and never copy the underlying block.
+
+    The schema works as described below:
+
+    - Create schema :
+        >>> schema = PackedSchema(ts='q', price='d', qty='I')
+
+    - Pack records :
+        >>> block = schema.pack_many([(1, 10.5, 3), (2, 10.25, 7)])
+
+    - Read records back :
+        >>> for record in schema.iter_views(block):
+        ...     record["price"]
+
+    Fields are packed in declaration order, little-endian and without padding,
+    so the same block can be saved to disk and later mapped back with mmap"""
+
+    def __init__(self, **fields):
+        """Initializes self"""
+
+        if not fields:
+            raise ValueError("a schema needs at least one field")
+        self._fields = dict()  # Field name -> (byte offset inside the record, single-field Struct)
+        self._ordered = []  # The same (offset, Struct) couples, in field order
+        self._indexes = dict()  # Field name -> numerical index of the field
+        offset = 0
+        for index, (key, code) in enumerate(fields.items()):
+            try:
+                field = struct.Struct("<" + code)
+            except (struct.error, TypeError):
+                raise ValueError(f"invalid format code '{code}' for field '{key}'") from None
+            if len(field.unpack(bytes(field.size))) != 1:
+                raise ValueError(f"format code '{code}' for field '{key}' must describe exactly one value")
+            self._fields[key] = (offset, field)
+            self._ordered.append((offset, field))
+            self._indexes[key] = index
+            offset += field.size
+        self._struct = struct.Struct("<" + "".join(fields.values()))
+        self.format = self._struct.format
+        self.size = self._struct.size  # Bytes taken by a single record
+
+    def keys(self):
+        """This function returns all the field names of the schema"""
+
+        return list(self._fields.keys())
+
+    def count(self, buffer):
+        """This function returns the number of records stored inside buffer"""
+
+        length = memoryview(buffer).nbytes
+        if length % self.size:
+            raise ValueError(f"buffer length {length} is not a multiple of the record size {self.size}")
+        return length // self.size
+
+    def pack(self, *args, **kwargs):
+        """This function packs a single record, given either its values
+        in field order or as key-word arguments, and returns it as bytes"""
+
+        if kwargs:
+            if args:
+                raise TypeError("pack() takes either positional or key-word arguments, not both")
+            missing = [key for key in self._fields if key not in kwargs]
+            if missing:
+                raise TypeError(f"pack() missing fields: {', '.join(missing)}")
+            unexpected = [key for key in kwargs if key not in self._fields]
+            if unexpected:
+                raise TypeError(f"pack() got unexpected fields: {', '.join(unexpected)}")
+            args = [kwargs[key] for key in self._fields]
+        return self._struct.pack(*args)
+
+    def pack_many(self, records):
+        """This function packs an iterable of records into a single bytes block.
+
+        Every record can be either a sequence of values in field order or
+        a mapping (a dict, a NamedTuple, ...) from field names to values"""
+
+        pack = self._struct.pack
+        keys = list(self._fields)
+        return b"".join(pack(*(record[key] for key in keys)) if hasattr(record, "keys") else pack(*record)
+                        for record in records)
+
+    def view(self, buffer, index=0):
+        """This function returns a view over the index-th record inside buffer"""
+
+        count = self.count(buffer)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("record index out of range")
+        return PackedNamedTuple(self, memoryview(buffer), index * self.size)
+
+    def iter_views(self, buffer):
+        """This function yields a view over every record inside buffer, in order.
+
+        All the views share one memoryview over buffer: as long as any of them is
+        alive, a bytearray can't be resized and an mmap can't be closed"""
+
+        data = memoryview(buffer)
+        for offset in range(0, self.count(data) * self.size, self.size):
+            yield PackedNamedTuple(self, data, offset)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return "PackedSchema(" + ", ".join(f"{key}='{field.format[1:]}'" for key, (_, field)
+                                           in self._fields.items()) + ")"
+
+
+class PackedNamedTuple:
+    """This class implements a lightweight, read-only view over a single record
+    packed according to a PackedSchema. It behaves like a NamedTuple, but fields
+    are decoded from the underlying memory only when they're accessed.
+
+    Views are created by PackedSchema.view() and PackedSchema.iter_views()
+    and are not meant to be instantiated directly"""
+
+    __slots__ = ("_schema", "_buffer", "_offset")
+
+    def __init__(self, schema, buffer, offset):
+        """Initializes self"""
+
+        self._schema = schema
+        self._buffer = buffer
+        self._offset = offset
+
+    def _unpack(self):
+        return self._schema._struct.unpack_from(self._buffer, self._offset)
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            if index < 0:
+                index += len(self._schema._ordered)
+            if not 0 <= index < len(self._schema._ordered):
+                raise IndexError("tuple index out of range")
+            offset, field = self._schema._ordered[index]
+            return field.unpack_from(self._buffer, self._offset + offset)[0]
+        elif isinstance(index, slice):
+            return self._unpack()[index]
+        elif index in self._schema._fields:
+            offset, field = self._schema._fields[index]
+            return field.unpack_from(self._buffer, self._offset + offset)[0]
+        else:
+            raise KeyError(f"{index}")
+
+    def __iter__(self):
+        return iter(self._unpack())
+
+    def __contains__(self, item):
+        return item in self._unpack()
+
+    def __len__(self):
+        return len(self._schema)
+
+    def find(self, item):
+        """This function finds an element inside the tuple,
+        given its key"""
+
+        if item in self._schema._indexes:
+            return self._schema._indexes[item]
+        else:
+            raise KeyError("item not in tuple")
+
+    def keys(self):
+        """This function returns all the keys inside the tuple"""
+
+        return self._schema.keys()
+
+    def items(self):
+        """This function returns all the values inside the tuple"""
+
+        return list(zip(self._schema._fields, self._unpack()))
+
+    def as_dict(self):
+        return dict(self.items())
+
+    def __str__(self):
+        return "(" + ", ".join(f"{key}={value!r}" for key, value in self.items()) + ")"
+
+    def __repr__(self):
+        return self.__str__()